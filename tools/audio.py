@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Optional
 
 from langchain.tools import tool
@@ -65,6 +66,7 @@ def audio_transcribe(
     """
 
     import httpx
+    import os
     import shutil
     import subprocess
     import tempfile
@@ -85,82 +87,99 @@ def audio_transcribe(
             "error": "Path is not a file.",
         }
 
-    temp_dir: Optional[tempfile.TemporaryDirectory] = None
+    temp_path: Optional[str] = None
     upload_path = audio_path
     converted = False
 
-    if audio_path.suffix.lower() != ".wav":
-        if not convert_to_wav:
-            return {
-                "status": "error",
-                "audio": virtual_audio_path,
-                "error": "Input is not WAV. Enable convert_to_wav or start the server with --convert.",
-            }
-
-        ffmpeg = shutil.which("ffmpeg")
-        if not ffmpeg:
-            return {
-                "status": "error",
-                "audio": virtual_audio_path,
-                "error": "ffmpeg not found on PATH. Install ffmpeg or disable convert_to_wav.",
-            }
+    try:
+        if audio_path.suffix.lower() != ".wav":
+            if not convert_to_wav:
+                return {
+                    "status": "error",
+                    "audio": virtual_audio_path,
+                    "error": "Input is not WAV. Enable convert_to_wav or start the server with --convert.",
+                }
+
+            ffmpeg = shutil.which("ffmpeg")
+            if not ffmpeg:
+                return {
+                    "status": "error",
+                    "audio": virtual_audio_path,
+                    "error": "ffmpeg not found on PATH. Install ffmpeg or disable convert_to_wav.",
+                }
+
+            # Prefer a single RAM-backed file (tmpfs on Linux); /dev/shm is often small
+            # (64 MiB in Docker), so retry in the default temp dir if ffmpeg fails there.
+            temp_dirs = ["/dev/shm", None] if os.path.isdir("/dev/shm") else [None]
+            for temp_dir in temp_dirs:
+                if temp_path is not None:
+                    os.unlink(temp_path)
+                    temp_path = None
+                with tempfile.NamedTemporaryFile(
+                    prefix=f"{audio_path.stem}-",
+                    suffix=".wav",
+                    delete=False,
+                    dir=temp_dir,
+                ) as handle:
+                    temp_path = handle.name
+                cmd = [
+                    ffmpeg,
+                    "-hide_banner",
+                    "-loglevel",
+                    "error",
+                    "-y",
+                    "-i",
+                    str(audio_path),
+                    "-ar",
+                    "16000",
+                    "-ac",
+                    "1",
+                    "-c:a",
+                    "pcm_s16le",
+                    temp_path,
+                ]
+                result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+                if result.returncode == 0:
+                    break
+            else:
+                return {
+                    "status": "error",
+                    "audio": virtual_audio_path,
+                    "error": "ffmpeg failed to convert the input to WAV.",
+                    "details": result.stderr.strip() or "No stderr output.",
+                }
+
+            upload_path = Path(temp_path)
+            converted = True
+
+        data = {
+            "temperature": str(temperature),
+            "temperature_inc": str(temperature_inc),
+            "response_format": response_format,
+        }
+        if language:
+            data["language"] = language
+        if prompt:
+            data["prompt"] = prompt
 
-        temp_dir = tempfile.TemporaryDirectory()
-        output_path = Path(temp_dir.name) / f"{audio_path.stem}.wav"
-        cmd = [
-            ffmpeg,
-            "-hide_banner",
-            "-loglevel",
-            "error",
-            "-y",
-            "-i",
-            str(audio_path),
-            "-ar",
-            "16000",
-            "-ac",
-            "1",
-            "-c:a",
-            "pcm_s16le",
-            str(output_path),
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        if result.returncode != 0:
-            temp_dir.cleanup()
+        content_type = "audio/wav" if upload_path.suffix.lower() == ".wav" else "application/octet-stream"
+        try:
+            with upload_path.open("rb") as handle:
+                files = {"file": (upload_path.name, handle, content_type)}
+                with httpx.Client(timeout=timeout_sec) as client:
+                    response = client.post(server_url, data=data, files=files)
+        except httpx.RequestError as exc:
             return {
                 "status": "error",
                 "audio": virtual_audio_path,
-                "error": "ffmpeg failed to convert the input to WAV.",
-                "details": result.stderr.strip() or "No stderr output.",
+                "error": f"Request failed: {exc}",
             }
-
-        upload_path = output_path
-        converted = True
-
-    data = {
-        "temperature": str(temperature),
-        "temperature_inc": str(temperature_inc),
-        "response_format": response_format,
-    }
-    if language:
-        data["language"] = language
-    if prompt:
-        data["prompt"] = prompt
-
-    content_type = "audio/wav" if upload_path.suffix.lower() == ".wav" else "application/octet-stream"
-    try:
-        with upload_path.open("rb") as handle:
-            files = {"file": (upload_path.name, handle, content_type)}
-            with httpx.Client(timeout=timeout_sec) as client:
-                response = client.post(server_url, data=data, files=files)
-    except httpx.RequestError as exc:
-        return {
-            "status": "error",
-            "audio": virtual_audio_path,
-            "error": f"Request failed: {exc}",
-        }
     finally:
-        if temp_dir is not None:
-            temp_dir.cleanup()
+        if temp_path is not None:
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
 
     if response.is_error:
         body = response.text.strip()
@@ -1,23 +1,86 @@
 from __future__ import annotations
 
 import argparse
-import json
+import asyncio
+import functools
+import importlib.util
+import io
+import mmap
+import os
 import shutil
+import struct
 import subprocess
+import sys
 import tempfile
 import time
+import wave
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    IO,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+)
 
 import httpx
-from rich.console import Console
-from rich.json import JSON
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
+import orjson
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
 
 DEFAULT_FILE = Path("workspace") / "20250528134121-_______-___-1_1_.m4a"
 DEFAULT_URL = "http://127.0.0.1:8080/inference"
+# HTTP/2 needs the optional ``h2`` package (``httpx[http2]``); fall back to HTTP/1.1 without it.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+# Incremental JSON parsing of long transcripts needs the optional ``ijson`` package.
+IJSON_AVAILABLE = importlib.util.find_spec("ijson") is not None
+# In-process decoding needs the optional PyAV package; fall back to the ffmpeg CLI without it.
+AV_AVAILABLE = importlib.util.find_spec("av") is not None
+UPLOAD_CHUNK_SIZE = 1 << 20
+PIPE_CHUNK_SIZE = 1 << 16
+TARGET_SAMPLE_RATE = 16000
+FLAC_COMPRESSION_LEVEL = "5"
+ERROR_BODY_LIMIT = 4096
+# Above this many segments Rich's table layout dominates; print plain lines instead.
+PLAIN_SEGMENTS_THRESHOLD = 500
+# Responses smaller than this are read in full; streaming only pays off for long transcripts.
+STREAM_MIN_BYTES = 64 * 1024
+# Fallback JSON bodies above this size are shown as a head/tail excerpt unless --full-json.
+JSON_PREVIEW_THRESHOLD = 64 * 1024
+JSON_PREVIEW_HEAD = 4096
+JSON_PREVIEW_TAIL = 1024
+CONTENT_TYPES = {".wav": "audio/wav", ".flac": "audio/flac"}
+
+
+class PipedAudio(NamedTuple):
+    """ffmpeg process whose stdout is streamed straight into the upload."""
+
+    name: str
+    process: subprocess.Popen
+    # stderr goes to a file so a chatty ffmpeg can't fill a pipe nobody drains and stall.
+    stderr: IO[bytes]
+
+
+UploadSource = Union[Path, io.BytesIO, PipedAudio]
+
+
+def positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 def parse_args() -> argparse.Namespace:
@@ -26,8 +89,9 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--file",
         type=Path,
-        default=DEFAULT_FILE,
-        help="Path to audio file to transcribe.",
+        nargs="+",
+        default=[DEFAULT_FILE],
+        help="Path(s) to audio file(s) to transcribe.",
     )
     parser.add_argument(
         "--response-format",
@@ -47,7 +111,14 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--no-convert",
         action="store_true",
-        help="Do not convert non-WAV input to WAV before upload.",
+        help="Skip local conversion: upload WAV as-is and reject other formats.",
+    )
+    parser.add_argument(
+        "--container",
+        default="wav",
+        choices=["wav", "flac"],
+        help="Upload container after conversion; flac halves bytes on the wire "
+        "but needs a server built with libavcodec.",
     )
     parser.add_argument(
         "--timeout",
@@ -55,6 +126,17 @@ def parse_args() -> argparse.Namespace:
         default=300.0,
         help="Request timeout in seconds.",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=positive_int,
+        default=None,
+        help="Maximum in-flight requests (default: min(number of files, 4)).",
+    )
+    parser.add_argument(
+        "--full-json",
+        action="store_true",
+        help="Pretty-print unrecognized JSON responses in full, however large.",
+    )
     return parser.parse_args()
 
 
@@ -73,30 +155,49 @@ def format_seconds(value: Optional[float]) -> str:
     return f"{minutes:02d}:{seconds:02d}.{millis:03d}"
 
 
-def extract_result(payload: Any) -> Any:
-    if isinstance(payload, dict):
-        if "text" in payload or "segments" in payload:
-            return payload
-        if isinstance(payload.get("result"), dict):
-            return payload["result"]
-    return payload
+def iter_segment_rows(
+    segments: Sequence[Dict[str, Any]],
+    first: int = 1,
+) -> Iterator[tuple[str, str, str, str]]:
+    fmt = format_seconds
+    for idx, segment in enumerate(segments, start=first):
+        get = segment.get
+        yield str(idx), fmt(get("start")), fmt(get("end")), (get("text") or "").strip()
 
 
-def build_segments_table(segments: Iterable[Dict[str, Any]]) -> Table:
+def build_segments_table(segments: Sequence[Dict[str, Any]]) -> Table:
+    from rich.table import Table
+
     table = Table(title="Segments", show_lines=False)
     table.add_column("#", style="cyan", justify="right", no_wrap=True)
     table.add_column("Start", style="green", no_wrap=True)
     table.add_column("End", style="green", no_wrap=True)
     table.add_column("Text", style="white")
-    for idx, segment in enumerate(segments, start=1):
-        start = format_seconds(segment.get("start"))
-        end = format_seconds(segment.get("end"))
-        text = (segment.get("text") or "").strip()
-        table.add_row(str(idx), start, end, text)
+    add_row = table.add_row
+    for row in iter_segment_rows(segments):
+        add_row(*row)
     return table
 
 
-def print_result(console: Console, response: httpx.Response, elapsed: float) -> None:
+def format_segments_plain(segments: Sequence[Dict[str, Any]], first: int = 1) -> str:
+    return "\n".join(
+        f"{idx:>5}  {start}  {end}  {text}"
+        for idx, start, end, text in iter_segment_rows(segments, first)
+    )
+
+
+def write_raw(content: bytes) -> None:
+    sys.stdout.flush()
+    sys.stdout.buffer.write(content)
+    if not content.endswith(b"\n"):
+        sys.stdout.buffer.write(b"\n")
+    sys.stdout.buffer.flush()
+
+
+def print_summary(console: Console, response: httpx.Response, elapsed: float) -> None:
+    from rich.panel import Panel
+    from rich.text import Text
+
     summary = Text()
     summary.append("Status: ", style="bold")
     summary.append(f"{response.status_code} {response.reason_phrase}\n")
@@ -104,36 +205,449 @@ def print_result(console: Console, response: httpx.Response, elapsed: float) ->
     summary.append(f"{elapsed:.2f}s")
     console.print(Panel(summary, title="Request Summary", expand=False))
 
-    if response.headers.get("content-type", "").startswith("application/json"):
-        payload = response.json()
-    else:
-        try:
-            payload = response.json()
-        except json.JSONDecodeError:
-            payload = response.text
+
+def print_payload(
+    console: Console, payload: Any, size: int = 0, full_json: bool = False
+) -> None:
+    from rich.panel import Panel
+    from rich.text import Text
 
     if isinstance(payload, str):
         console.print(Panel(payload.strip(), title="Transcript", expand=False))
         return
 
-    result = extract_result(payload)
-    if isinstance(result, dict):
-        text = result.get("text")
+    if isinstance(payload, dict):
+        text = payload.get("text")
+        segments = payload.get("segments")
+        if text is None and segments is None:
+            try:
+                nested = payload["result"]
+                text = nested.get("text")
+                segments = nested.get("segments")
+            except (KeyError, AttributeError):
+                pass
         if text:
             console.print(Panel(Text(text.strip()), title="Transcript", expand=False))
-        segments = result.get("segments")
         if isinstance(segments, list) and segments:
-            console.print(build_segments_table(segments))
+            if len(segments) > PLAIN_SEGMENTS_THRESHOLD:
+                print(format_segments_plain(segments), flush=True)
+            else:
+                console.print(build_segments_table(segments))
             return
 
+    print_json_panel(console, payload, size, full_json)
+
+
+def print_json_panel(
+    console: Console, payload: Any, size: int = 0, full_json: bool = False
+) -> None:
+    from rich.panel import Panel
+    from rich.text import Text
+
+    if size > JSON_PREVIEW_THRESHOLD and not full_json:
+        # Rich's JSON highlighter is slow on large bodies; show a plain excerpt instead.
+        dumped = orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8")
+        excerpt = (
+            f"{dumped[:JSON_PREVIEW_HEAD]}\n...[truncated, use --full-json]...\n"
+            f"{dumped[-JSON_PREVIEW_TAIL:]}"
+        )
+        console.print(Panel(Text(excerpt), title="Response JSON (truncated)", expand=False))
+        return
+
+    from rich.json import JSON
+
     console.print(Panel(JSON.from_data(payload), title="Response JSON", expand=False))
 
 
+def decode_payload(response: httpx.Response, content: bytes) -> Any:
+    if response.headers.get("content-type", "").startswith("application/json"):
+        return orjson.loads(content)
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return content.decode(response.encoding or "utf-8", "replace")
+
+
+def print_result(
+    console: Console,
+    response: httpx.Response,
+    elapsed: float,
+    response_format: str = "json",
+    full_json: bool = False,
+) -> None:
+    print_summary(console, response, elapsed)
+
+    content = response.content
+    if response_format != "json":
+        # text/srt/vtt/tsv come back as plain text; write it through untouched.
+        write_raw(content)
+        return
+
+    print_payload(console, decode_payload(response, content), len(content), full_json)
+
+
+class StreamedResultParser:
+    """Push parser yielding the transcript text and segments as JSON bytes arrive."""
+
+    # Only top-level keys are streamed; a nested "result" is left to print_payload.
+    SEGMENT_PREFIX = "segments.item"
+    TEXT_PREFIX = "text"
+
+    def __init__(self) -> None:
+        import ijson
+
+        self._ijson = ijson
+        self._events = ijson.sendable_list()
+        self._coro = ijson.parse_coro(self._events, use_float=True)
+        self._builder: Any = None
+
+    def feed(self, chunk: bytes) -> List[tuple[str, Any]]:
+        self._coro.send(chunk)
+        return self._drain()
+
+    def close(self) -> List[tuple[str, Any]]:
+        self._coro.close()
+        return self._drain()
+
+    def _drain(self) -> List[tuple[str, Any]]:
+        found = []
+        for prefix, event, value in self._events:
+            if self._builder is not None:
+                self._builder.event(event, value)
+                if event == "end_map" and prefix == self.SEGMENT_PREFIX:
+                    found.append(("segment", self._builder.value))
+                    self._builder = None
+            elif event == "start_map" and prefix == self.SEGMENT_PREFIX:
+                self._builder = self._ijson.ObjectBuilder()
+                self._builder.event(event, value)
+            elif event == "string" and prefix == self.TEXT_PREFIX:
+                found.append(("text", value))
+        del self._events[:]
+        return found
+
+
+def should_stream(response: httpx.Response) -> bool:
+    length = response.headers.get("content-length")
+    if length is None:
+        return True
+    try:
+        return int(length) >= STREAM_MIN_BYTES
+    except ValueError:
+        return False
+
+
+async def print_streamed_result(
+    console: Console, response: httpx.Response, start: float, full_json: bool = False
+) -> None:
+    """Render like print_payload, but show text and segments while the body downloads."""
+    import ijson
+    from rich.live import Live
+    from rich.panel import Panel
+    from rich.text import Text
+
+    print_summary(console, response, time.perf_counter() - start)
+
+    parser: Optional[StreamedResultParser] = StreamedResultParser()
+    table = build_segments_table([])
+    buffered: List[bytes] = []
+    seen = {"text": False, "segments": 0}
+    live = Live(table, console=console, refresh_per_second=8, transient=True)
+
+    def render(events: List[tuple[str, Any]]) -> None:
+        batch = []
+        for kind, value in events:
+            if kind == "text":
+                if value:
+                    seen["text"] = True
+                    console.print(Panel(Text(value.strip()), title="Transcript", expand=False))
+            else:
+                batch.append(value)
+        if not batch:
+            return
+        first = seen["segments"] + 1
+        seen["segments"] += len(batch)
+        if seen["segments"] > PLAIN_SEGMENTS_THRESHOLD:
+            # Past this size Rich re-renders are too costly; freeze the table and go plain.
+            if live.is_started:
+                live.stop()
+                if table.row_count:
+                    console.print(table)
+            print(format_segments_plain(batch, first), flush=True)
+            return
+        add_row = table.add_row
+        for row in iter_segment_rows(batch, first):
+            add_row(*row)
+
+    with live:
+        async for chunk in response.aiter_bytes():
+            buffered.append(chunk)
+            if parser is None:
+                continue
+            try:
+                render(parser.feed(chunk))
+            except ijson.JSONError:
+                # Not (valid) JSON: keep buffering and let print_payload handle it.
+                parser = None
+        if parser is not None:
+            try:
+                render(parser.close())
+            except ijson.JSONError:
+                parser = None
+    if 0 < seen["segments"] <= PLAIN_SEGMENTS_THRESHOLD:
+        console.print(table)
+
+    if parser is not None and seen["segments"]:
+        return
+    content = b"".join(buffered)
+    payload = decode_payload(response, content)
+    if parser is not None and seen["text"]:
+        # print_payload would repeat the transcript already shown, then fall through here.
+        print_json_panel(console, payload, len(content), full_json)
+    else:
+        print_payload(console, payload, len(content), full_json)
+
+
+@functools.cache
+def get_console() -> Console:
+    from rich.console import Console
+
+    return Console()
+
+
+@functools.lru_cache(maxsize=None)
+def get_client(timeout: float) -> httpx.Client:
+    return httpx.Client(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=30),
+        timeout=timeout,
+    )
+
+
+def build_form_data(
+    response_format: str = "json",
+    temperature: float = 0.0,
+    temperature_inc: float = 0.2,
+    language: Optional[str] = None,
+    prompt: Optional[str] = None,
+) -> Dict[str, str]:
+    data = {
+        "temperature": str(temperature),
+        "temperature_inc": str(temperature_inc),
+        "response_format": response_format,
+    }
+    if language:
+        data["language"] = language
+    if prompt:
+        data["prompt"] = prompt
+    return data
+
+
+def iter_file(path: Path, chunk_size: int = UPLOAD_CHUNK_SIZE) -> Iterator[memoryview]:
+    """Yield memory-mapped slices, releasing each before the next so the map can close."""
+    with path.open("rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if not size:
+            return
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                for offset in range(0, size, chunk_size):
+                    chunk = view[offset : offset + chunk_size]
+                    try:
+                        yield chunk
+                    finally:
+                        chunk.release()
+
+
+def encode_multipart(
+    data: Dict[str, str],
+    filename: str,
+    chunks: Iterable[bytes],
+    content_type: str,
+    size: Optional[int] = None,
+) -> tuple[Dict[str, str], Iterator[bytes]]:
+    """Frame form fields and a file as a lazily streamed multipart/form-data body."""
+    boundary = os.urandom(16).hex()
+    parts = []
+    for name, value in data.items():
+        parts.append(
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+            f"{value}\r\n"
+        )
+    safe_name = filename.replace('"', "%22")
+    parts.append(
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="{safe_name}"\r\n'
+        f"Content-Type: {content_type}\r\n\r\n"
+    )
+    head = "".join(parts).encode("utf-8")
+    tail = f"\r\n--{boundary}--\r\n".encode("ascii")
+
+    headers = {"Content-Type": f"multipart/form-data; boundary={boundary}"}
+    if size is not None:
+        headers["Content-Length"] = str(len(head) + size + len(tail))
+
+    def body() -> Iterator[bytes]:
+        yield head
+        yield from chunks
+        yield tail
+
+    return headers, body()
+
+
+def iter_buffer(buffer: io.BytesIO, chunk_size: int = UPLOAD_CHUNK_SIZE) -> Iterator[bytes]:
+    buffer.seek(0)
+    yield from iter(lambda: buffer.read(chunk_size), b"")
+
+
+def build_upload_body(
+    upload: UploadSource, **opts: Any
+) -> tuple[Dict[str, str], Iterator[bytes]]:
+    data = build_form_data(**opts)
+    name = upload.name
+    content_type = CONTENT_TYPES.get(Path(name).suffix.lower(), "application/octet-stream")
+    if isinstance(upload, Path):
+        chunks, size = iter_file(upload), upload.stat().st_size
+    elif isinstance(upload, PipedAudio):
+        stdout = upload.process.stdout
+        chunks, size = iter(lambda: stdout.read(PIPE_CHUNK_SIZE), b""), None
+    else:
+        chunks, size = iter_buffer(upload), upload.getbuffer().nbytes
+    return encode_multipart(data, name, chunks, content_type, size=size)
+
+
+async def aiter_chunks(chunks: Iterator[bytes]) -> AsyncIterator[bytes]:
+    """Drive a blocking chunk iterator from a worker thread so reads don't stall the loop."""
+    while True:
+        chunk = await asyncio.to_thread(next, chunks, None)
+        if chunk is None:
+            return
+        yield chunk
+
+
+def transcribe(
+    upload: UploadSource,
+    url: str = DEFAULT_URL,
+    *,
+    timeout: float = 300.0,
+    **opts: Any,
+) -> tuple[httpx.Response, float]:
+    headers, body = build_upload_body(upload, **opts)
+    client = get_client(timeout)
+    start = time.perf_counter()
+    response = client.post(url, content=body, headers=headers)
+    elapsed = time.perf_counter() - start
+    return response, elapsed
+
+
+async def atranscribe(
+    client: httpx.AsyncClient,
+    upload: UploadSource,
+    url: str = DEFAULT_URL,
+    **opts: Any,
+) -> tuple[httpx.Response, float]:
+    headers, body = build_upload_body(upload, **opts)
+    start = time.perf_counter()
+    response = await client.post(url, content=aiter_chunks(body), headers=headers)
+    elapsed = time.perf_counter() - start
+    return response, elapsed
+
+
+async def atranscribe_stream(
+    client: httpx.AsyncClient,
+    upload: UploadSource,
+    url: str = DEFAULT_URL,
+    **opts: Any,
+) -> tuple[httpx.Response, float]:
+    """Return once headers arrive; the caller reads and closes the response."""
+    headers, body = build_upload_body(upload, **opts)
+    start = time.perf_counter()
+    request = client.build_request("POST", url, content=aiter_chunks(body), headers=headers)
+    response = await client.send(request, stream=True)
+    return response, start
+
+
+def iter_resampled_frames(file_path: Path) -> Iterator[Any]:
+    import av
+
+    resampler = av.AudioResampler(format="s16", layout="mono", rate=TARGET_SAMPLE_RATE)
+    with av.open(str(file_path)) as container:
+        if not container.streams.audio:
+            raise ValueError("Input has no audio stream.")
+        for frame in container.decode(audio=0):
+            yield from resampler.resample(frame)
+    yield from resampler.resample(None)
+
+
+def decode_with_av(file_path: Path, container: str = "wav") -> io.BytesIO:
+    """Decode to 16 kHz mono s16 in-process as an in-memory WAV or FLAC."""
+    import av
+
+    buffer = io.BytesIO()
+    if container == "flac":
+        output = av.open(buffer, "w", format="flac")
+        try:
+            stream = output.add_stream(
+                "flac",
+                rate=TARGET_SAMPLE_RATE,
+                options={"compression_level": FLAC_COMPRESSION_LEVEL},
+            )
+            stream.codec_context.layout = "mono"
+            stream.codec_context.format = "s16"
+            for frame in iter_resampled_frames(file_path):
+                frame.pts = None
+                output.mux(stream.encode(frame))
+            output.mux(stream.encode(None))
+        finally:
+            output.close()
+    else:
+        with wave.open(buffer, "wb") as writer:
+            writer.setnchannels(1)
+            writer.setsampwidth(2)
+            writer.setframerate(TARGET_SAMPLE_RATE)
+            for frame in iter_resampled_frames(file_path):
+                writer.writeframes(bytes(frame.planes[0])[: frame.samples * 2])
+    buffer.name = f"{file_path.stem}.{container}"
+    buffer.seek(0)
+    return buffer
+
+
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH")
+_WAVE_FORMAT_PCM = 1
+
+
+def _probe_wav_fast(path: Path) -> Optional[tuple[int, int, int]]:
+    """Return (channels, rate, bits) from a canonical PCM WAV header, else None."""
+    try:
+        with path.open("rb") as handle:
+            header = handle.read(44)
+    except OSError:
+        return None
+    if len(header) < 44:
+        return None
+    riff, _, wave_tag, fmt_tag, _, audio_format, channels, rate, _, _, bits = (
+        _WAV_HEADER.unpack_from(header)
+    )
+    if (riff, wave_tag, fmt_tag) != (b"RIFF", b"WAVE", b"fmt "):
+        return None
+    if audio_format != _WAVE_FORMAT_PCM:
+        return None
+    return channels, rate, bits
+
+
+def is_normalized_wav(file_path: Path) -> bool:
+    return _probe_wav_fast(file_path) == (1, TARGET_SAMPLE_RATE, 16)
+
+
 def prepare_audio(
-    console: Console, file_path: Path, allow_convert: bool
-) -> tuple[Optional[Path], Optional[tempfile.TemporaryDirectory]]:
-    if file_path.suffix.lower() == ".wav":
-        return file_path, None
+    console: Console, file_path: Path, allow_convert: bool, container: str = "wav"
+) -> Optional[UploadSource]:
+    from rich.panel import Panel
+
+    if file_path.suffix.lower() == ".wav" and (
+        not allow_convert or (container == "wav" and is_normalized_wav(file_path))
+    ):
+        return file_path
     if not allow_convert:
         console.print(
             Panel(
@@ -142,63 +656,136 @@ def prepare_audio(
                 expand=False,
             )
         )
-        return None, None
+        return None
+
+    if AV_AVAILABLE:
+        import av
+
+        try:
+            buffer = decode_with_av(file_path, container)
+        except (av.error.FFmpegError, ValueError) as exc:
+            console.print(
+                Panel(
+                    f"PyAV failed to decode the input.\n\n{exc}",
+                    title="Conversion Error",
+                    expand=False,
+                )
+            )
+            return None
+        console.print(
+            Panel(
+                f"Decoded to in-memory {container.upper()} for upload:\n{buffer.name} ({buffer.getbuffer().nbytes} bytes)",
+                title="Preparing Audio",
+                expand=False,
+            )
+        )
+        return buffer
 
     ffmpeg = shutil.which("ffmpeg")
     if not ffmpeg:
         console.print(
             Panel(
-                "ffmpeg not found in PATH. Install ffmpeg or run whisper-server with --convert.",
+                "ffmpeg not found in PATH. Install ffmpeg or PyAV, or run whisper-server with --convert.",
                 title="Missing Dependency",
                 expand=False,
             )
         )
-        return None, None
+        return None
 
-    temp_dir = tempfile.TemporaryDirectory()
-    output_path = Path(temp_dir.name) / f"{file_path.stem}.wav"
     cmd = [
         ffmpeg,
         "-hide_banner",
+        "-nostdin",
         "-loglevel",
         "error",
-        "-y",
         "-i",
         str(file_path),
         "-ar",
         "16000",
         "-ac",
         "1",
-        "-c:a",
-        "pcm_s16le",
-        str(output_path),
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-    if result.returncode != 0:
-        console.print(
-            Panel(
-                f"ffmpeg failed to convert the input.\n\n{result.stderr.strip()}",
-                title="Conversion Error",
-                expand=False,
-            )
+    if container == "flac":
+        cmd += ["-c:a", "flac", "-compression_level", FLAC_COMPRESSION_LEVEL]
+    else:
+        cmd += ["-c:a", "pcm_s16le"]
+    cmd += ["-f", container, "pipe:1"]
+    stderr = tempfile.TemporaryFile()
+    try:
+        process = subprocess.Popen(
+            cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=stderr
         )
-        temp_dir.cleanup()
-        return None, None
-
+    except OSError:
+        stderr.close()
+        raise
     console.print(
         Panel(
-            f"Converted to WAV for upload:\n{output_path}",
+            f"Streaming ffmpeg {container.upper()} output into the upload.",
             title="Preparing Audio",
             expand=False,
         )
     )
-    return output_path, temp_dir
+    return PipedAudio(f"{file_path.stem}.{container}", process, stderr)
+
+
+def close_pipe(upload: PipedAudio, abort: bool = False) -> Optional[str]:
+    """Reap the ffmpeg process and return its error output if conversion failed."""
+    process = upload.process
+    if abort:
+        process.kill()
+    process.stdout.close()
+    process.wait()
+    with upload.stderr as stderr:
+        if abort or process.returncode == 0:
+            return None
+        stderr.seek(0)
+        head = stderr.read(ERROR_BODY_LIMIT).decode("utf-8", "replace")
+    message = head.rsplit("\n", 1)[0] if len(head) >= ERROR_BODY_LIMIT else head
+    message = message.strip()
+    return message or f"ffmpeg exited with code {process.returncode}"
+
+
+def describe_upload(upload: UploadSource) -> str:
+    if isinstance(upload, Path):
+        return str(upload)
+    if isinstance(upload, PipedAudio):
+        return f"{upload.name} (ffmpeg pipe)"
+    return f"{upload.name} (in memory)"
+
+
+async def post_one(
+    console: Console,
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    file_path: Path,
+    args: argparse.Namespace,
+) -> int:
+    from rich.markup import escape
+    from rich.panel import Panel
+
+    try:
+        return await transcribe_file(console, client, semaphore, file_path, args)
+    except Exception as exc:  # one bad file must not abort the rest of the batch
+        console.print(
+            Panel(
+                f"[red]{type(exc).__name__}:[/red] {escape(str(exc))}\n{escape(str(file_path))}",
+                title="Error",
+                expand=False,
+            )
+        )
+        return 1
 
 
-def main() -> int:
-    args = parse_args()
-    console = Console()
-    file_path = args.file.expanduser()
+async def transcribe_file(
+    console: Console,
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    file_path: Path,
+    args: argparse.Namespace,
+) -> int:
+    from rich.panel import Panel
+
+    file_path = file_path.expanduser()
     if not file_path.is_file():
         console.print(
             Panel(
@@ -209,58 +796,120 @@ def main() -> int:
         )
         return 2
 
-    upload_path, temp_dir = prepare_audio(console, file_path, not args.no_convert)
-    if upload_path is None:
-        return 2
+    async with semaphore:
+        upload = await asyncio.to_thread(
+            prepare_audio, console, file_path, not args.no_convert, args.container
+        )
+        if upload is None:
+            return 2
 
-    data = {
-        "temperature": str(args.temperature),
-        "temperature_inc": str(args.temperature_inc),
-        "response_format": args.response_format,
-    }
-    if args.language:
-        data["language"] = args.language
-    if args.prompt:
-        data["prompt"] = args.prompt
-
-    panel_lines = [
-        f"Source: {file_path}",
-        f"Upload: {upload_path}",
-        f"URL: {args.url}",
-        f"Format: {args.response_format}",
-    ]
-    console.print(Panel("\n".join(panel_lines), title="Whisper ASR", expand=False))
+        try:
+            panel_lines = [
+                f"Source: {file_path}",
+                f"Upload: {describe_upload(upload)}",
+                f"URL: {args.url}",
+                f"Format: {args.response_format}",
+            ]
+            console.print(Panel("\n".join(panel_lines), title="Whisper ASR", expand=False))
+
+            stream = IJSON_AVAILABLE and args.response_format == "json" and len(args.file) == 1
+            opts = dict(
+                response_format=args.response_format,
+                temperature=args.temperature,
+                temperature_inc=args.temperature_inc,
+                language=args.language,
+                prompt=args.prompt,
+            )
+            try:
+                if stream:
+                    response, start = await atranscribe_stream(client, upload, args.url, **opts)
+                else:
+                    response, elapsed = await atranscribe(client, upload, args.url, **opts)
+            except httpx.RequestError as exc:
+                console.print(
+                    Panel(
+                        f"[red]Request failed:[/red]\n{file_path}\n{exc}",
+                        title="Network Error",
+                        expand=False,
+                    )
+                )
+                return 1
+
+            if isinstance(upload, PipedAudio):
+                conversion_error = await asyncio.to_thread(close_pipe, upload)
+            else:
+                conversion_error = None
+        finally:
+            if isinstance(upload, PipedAudio) and not upload.stderr.closed:
+                await asyncio.to_thread(close_pipe, upload, True)
 
-    content_type = "audio/wav" if upload_path.suffix.lower() == ".wav" else "application/octet-stream"
     try:
-        with upload_path.open("rb") as handle:
-            files = {"file": (upload_path.name, handle, content_type)}
-            with httpx.Client(timeout=args.timeout) as client:
-                start = time.perf_counter()
-                response = client.post(args.url, data=data, files=files)
-                elapsed = time.perf_counter() - start
-    except httpx.RequestError as exc:
-        console.print(
-            Panel(f"[red]Request failed:[/red]\n{exc}", title="Network Error", expand=False)
-        )
-        return 1
-    finally:
-        if temp_dir is not None:
-            temp_dir.cleanup()
+        if conversion_error:
+            console.print(
+                Panel(
+                    f"ffmpeg failed to convert {file_path}.\n\n{conversion_error}",
+                    title="Conversion Error",
+                    expand=False,
+                )
+            )
+            return 1
 
-    if response.is_error:
-        body = response.text.strip() or "(empty response body)"
+        if len(args.file) > 1:
+            console.rule(str(file_path))
+
+        if response.is_error:
+            await response.aread()
+            body = (
+                response.content[:ERROR_BODY_LIMIT].decode("utf-8", "replace").strip()
+                or "(empty response body)"
+            )
+            console.print(
+                Panel(
+                    body,
+                    title=f"HTTP {response.status_code} {response.reason_phrase}",
+                    expand=False,
+                )
+            )
+            return 1
+
+        if stream and should_stream(response):
+            await print_streamed_result(console, response, start, args.full_json)
+            return 0
+        if stream:
+            await response.aread()
+            elapsed = time.perf_counter() - start
+        print_result(console, response, elapsed, args.response_format, args.full_json)
+        return 0
+    except httpx.RequestError as exc:
         console.print(
             Panel(
-                body,
-                title=f"HTTP {response.status_code} {response.reason_phrase}",
+                f"[red]Reading response failed:[/red]\n{file_path}\n{exc}",
+                title="Network Error",
                 expand=False,
             )
         )
         return 1
+    finally:
+        await response.aclose()
+
+
+async def _amain(args: argparse.Namespace) -> int:
+    console = get_console()
+    concurrency = args.concurrency if args.concurrency is not None else min(len(args.file), 4)
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, keepalive_expiry=30)
+    async with httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE, limits=limits, timeout=args.timeout
+    ) as client:
+        codes = await asyncio.gather(
+            *(post_one(console, client, semaphore, path, args) for path in args.file)
+        )
+    return max(codes)
 
-    print_result(console, response, elapsed)
-    return 0
+
+def main() -> int:
+    args = parse_args()
+    return asyncio.run(_amain(args))
 
 
 if __name__ == "__main__":